@@ -44,8 +44,11 @@ namespace FhirPathComparison
             _xmlParser = new FhirXmlParser();
             _fhirPathCompiler = new FhirPathCompiler();
 
-            // Load test configuration
-            var configPath = Path.Combine(_testCasesDir, "test-config.json");
+            // Load test configuration, preferring the snapshot shared by run-comparison.py
+            var sharedConfig = Environment.GetEnvironmentVariable("FHIRPATH_CONFIG_PATH");
+            var configPath = string.IsNullOrEmpty(sharedConfig)
+                ? Path.Combine(_testCasesDir, "test-config.json")
+                : sharedConfig;
             var configJson = File.ReadAllText(configPath);
             _testConfig = JsonNode.Parse(configJson);
         }
@@ -149,8 +149,11 @@ func NewGoTestRunner() (*GoTestRunner, error) {
 		return nil, fmt.Errorf("failed to create results directory: %v", err)
 	}
 
-	// Load test configuration
-	configPath := filepath.Join(runner.testCasesDir, "test-config.json")
+	// Load test configuration, preferring the snapshot shared by run-comparison.py
+	configPath := os.Getenv("FHIRPATH_CONFIG_PATH")
+	if configPath == "" {
+		configPath = filepath.Join(runner.testCasesDir, "test-config.json")
+	}
 	configData, err := ioutil.ReadFile(configPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read test config: %v", err)
@@ -59,8 +59,11 @@ public class TestRunner {
         this.xmlParser = fhirContext.newXmlParser();
         this.objectMapper = new ObjectMapper();
 
-        // Load test configuration
-        Path configPath = testCasesDir.resolve("test-config.json");
+        // Load test configuration, preferring the snapshot shared by run-comparison.py
+        String sharedConfig = System.getenv("FHIRPATH_CONFIG_PATH");
+        Path configPath = sharedConfig != null && !sharedConfig.isEmpty()
+            ? Paths.get(sharedConfig)
+            : testCasesDir.resolve("test-config.json");
         this.testConfig = objectMapper.readTree(configPath.toFile());
     }
 
@@ -22,8 +22,8 @@ class JavaScriptTestRunner {
             fs.mkdirSync(this.resultsDir, { recursive: true });
         }
 
-        // Load test configuration
-        const configPath = path.join(this.testCasesDir, 'test-config.json');
+        // Load test configuration, preferring the snapshot shared by run-comparison.py
+        const configPath = process.env.FHIRPATH_CONFIG_PATH || path.join(this.testCasesDir, 'test-config.json');
         this.testConfig = JSON.parse(fs.readFileSync(configPath, 'utf8'));
     }
 
@@ -9,14 +9,94 @@ across different programming language implementations.
 import os
 import sys
 import json
+import asyncio
+import functools
+import hashlib
 import subprocess
 import time
-import glob
+import fnmatch
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file, reusing the result until the file's mtime changes.
+
+    The returned object is shared between callers; copy it before mutating.
+    """
+    with open(path_str, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and oversized integers are accepted by json but not orjson
+            pass
+    return json.loads(data)
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # Values orjson cannot encode (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(data).encode('utf-8')
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON file through the mtime-keyed cache."""
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+# Longest line read from a runner or serve-mode protocol frame
+STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# Lines of runner output kept in memory for error reports; the rest is only in the log
+OUTPUT_TAIL_LINES = 200
+
 class ComparisonRunner:
+    # Files that determine each implementation's dependencies; setup is skipped
+    # while their combined hash matches the last successful setup
+    _MANIFESTS = {
+        "javascript": ["package-lock.json", "package.json"],
+        "python": ["requirements.txt"],
+        "java": ["pom.xml"],
+        "csharp": ["*.csproj"],
+        "rust": ["Cargo.lock", "Cargo.toml"],
+        "go": ["go.sum", "go.mod"],
+    }
+
+    # What setup leaves behind; if it has been deleted setup runs again. Python
+    # is checked through _find_venv_python instead.
+    _SETUP_OUTPUTS = {
+        "javascript": "node_modules",
+        "java": "target",
+        "csharp": "obj",
+        "rust": "target",
+    }
+
+    # Runner command per language for a mode ("test" or "benchmark"). Python is
+    # not listed: it is driven through a persistent `test_runner.py --serve` worker.
+    _COMMANDS = {
+        "javascript": lambda mode: ["node", "test-runner.js", mode],
+        "java": lambda mode: ["mvn", "compile", "exec:java",
+                              "-Dexec.mainClass=org.fhirpath.comparison.TestRunner", f"-Dexec.args={mode}"],
+        "csharp": lambda mode: ["dotnet", "run", "--", mode],
+        "rust": lambda mode: ["cargo", "run", "--", mode],
+        "go": lambda mode: ["go", "run", "main.go", mode],
+    }
+
+    # Virtual environment directories probed for the Python implementation, in order
+    _VENV_DIRS = ("venv", ".venv", "env", ".env")
+    _VENV_PY_REL = Path("Scripts/python.exe") if sys.platform == "win32" else Path("bin/python")
+
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.implementations_dir = project_root / "implementations"
@@ -25,71 +105,255 @@ class ComparisonRunner:
         self.results_dir.mkdir(exist_ok=True)
 
         # Load test configuration
-        with open(self.test_cases_dir / "test-config.json", 'r') as f:
-            self.test_config = json.load(f)
+        self.test_config = _load_json(self.test_cases_dir / "test-config.json")
 
-    def cleanup_old_results(self, language: str, result_type: str):
-        """Remove old result files for a specific language and result type, keeping only the most recent."""
-        pattern = f"{language}_{result_type}_*.json"
-        result_files = list(self.results_dir.glob(pattern))
+        # Runners read this compact snapshot instead of the original, so every
+        # language sees the same configuration even if it is edited mid-run
+        config_snapshot = self.results_dir / ".config.cached.json"
+        config_snapshot.write_bytes(_dumps(self.test_config))
+        self._runner_env = {**os.environ, "FHIRPATH_CONFIG_PATH": str(config_snapshot)}
 
-        if len(result_files) > 0:
-            # Sort by modification time, newest first
-            result_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # Manifest hashes of the last successful setup per language
+        self._setup_cache_file = self.results_dir / ".setup_cache.json"
+        try:
+            self._setup_hashes: Dict[str, str] = dict(_load_json(self._setup_cache_file))
+        except (OSError, TypeError, ValueError):
+            self._setup_hashes = {}
+
+        # Interpreter resolved per Python implementation directory
+        self._venv_python_cache: Dict[Path, Path] = {}
+
+        # Long-running `test_runner.py --serve` processes, keyed by implementation directory
+        self._python_workers: Dict[Path, asyncio.subprocess.Process] = {}
+
+    async def __aenter__(self):
+        return self
 
-            # Remove all but the most recent file
-            for old_file in result_files:
+    async def __aexit__(self, *exc_info):
+        await self.close_workers()
+
+    async def close_workers(self):
+        """Shut down any persistent implementation workers."""
+        for worker in self._python_workers.values():
+            if worker.returncode is None:
+                worker.stdin.close()
                 try:
-                    old_file.unlink()
-                    print(f"🗑️  Removed old result file: {old_file.name}")
-                except Exception as e:
-                    print(f"⚠️  Could not remove {old_file.name}: {e}")
+                    await asyncio.wait_for(worker.wait(), timeout=10)
+                except asyncio.TimeoutError:
+                    worker.kill()
+                    await worker.wait()
+        self._python_workers.clear()
+
+    async def _run_command(self, cmd: List[str], cwd: Path):
+        """Run a command with inherited output without blocking the event loop, raising CalledProcessError on failure."""
+        proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd)
+        returncode = await proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+    async def _run_streamed(self, cmd: List[str], cwd: Path, log_path: Path):
+        """Run a command, streaming its combined output to log_path as it arrives.
+
+        Only the last OUTPUT_TAIL_LINES lines are held in memory; on failure they
+        are raised as the output of a CalledProcessError.
+        """
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd, env=self._runner_env, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT, limit=STREAM_LINE_LIMIT)
+        try:
+            with open(log_path, 'wb') as log:
+                async for line in proc.stdout:
+                    log.write(line)
+                    tail.append(line)
+        except BaseException:
+            # Overlong line, cancellation, ...: don't leave the child blocked on a
+            # full pipe. communicate() drains the paused pipe to EOF, without
+            # which wait() never completes, and then reaps the child.
+            proc.kill()
+            await proc.communicate()
+            raise
+
+        returncode = await proc.wait()
+        if returncode != 0:
+            output = b"".join(tail).decode("utf-8", errors="replace")
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+
+    async def _run_python_command(self, impl_dir: Path, python_executable: str, command: str, log_path: Path):
+        """Run a test_runner.py command on the persistent worker for impl_dir, starting it if needed."""
+        worker = self._python_workers.get(impl_dir)
+        if worker is None or worker.returncode is not None:
+            worker = await asyncio.create_subprocess_exec(
+                python_executable, "test_runner.py", "--serve", "--workers", "1", cwd=impl_dir, env=self._runner_env,
+                stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+                limit=STREAM_LINE_LIMIT)
+            self._python_workers[impl_dir] = worker
+
+        cmd = [python_executable, "test_runner.py", command]
+        # Output frames are written to the log as they arrive so the phase can
+        # be followed live; the final frame carries the return code
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        with open(log_path, 'w', encoding='utf-8') as log:
+            try:
+                worker.stdin.write(json.dumps({"cmd": command}).encode("utf-8") + b"\n")
+                await worker.stdin.drain()
+                while True:
+                    line = await worker.stdout.readline()
+                    if not line:
+                        returncode = await worker.wait()
+                        raise subprocess.CalledProcessError(
+                            returncode, cmd, output="".join(tail) or "worker exited without a response")
+
+                    frame = json.loads(line)
+                    if "output" not in frame:
+                        break
+                    log.write(frame["output"])
+                    log.flush()
+                    tail.extend(frame["output"].splitlines(keepends=True))
+            except BaseException:
+                # Unread frames would be picked up by the next command, so the
+                # worker is discarded; the next phase starts a fresh one
+                self._python_workers.pop(impl_dir, None)
+                if worker.returncode is None:
+                    worker.kill()
+                await worker.communicate()
+                raise
+
+        if frame["returncode"] != 0:
+            raise subprocess.CalledProcessError(frame["returncode"], cmd, output="".join(tail))
+
+    def _scan_results(self, language: str, result_type: str) -> List[Tuple[int, Path]]:
+        """List (mtime_ns, path) for the result files of a language and result type, newest first."""
+        prefix = f"{language}_{result_type}"
+        result_files = []
+        with os.scandir(self.results_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".json"):
+                    result_files.append((entry.stat().st_mtime_ns, Path(entry.path)))
+        result_files.sort(reverse=True)
+        return result_files
+
+    def cleanup_old_results(self, language: str, result_type: str) -> Optional[Tuple[int, Path]]:
+        """Remove old result files for a specific language and result type, keeping only the most recent.
+
+        Returns the (mtime_ns, path) of the file that was kept, if any.
+        """
+        result_files = self._scan_results(language, result_type)
+
+        # Remove all but the most recent file
+        for _, old_file in result_files[1:]:
+            try:
+                old_file.unlink()
+                print(f"🗑️  Removed old result file: {old_file.name}")
+            except Exception as e:
+                print(f"⚠️  Could not remove {old_file.name}: {e}")
+
+        return result_files[0] if result_files else None
+
+    def _load_new_results(self, language: str, result_type: str,
+                          previous: Optional[Tuple[int, Path]]) -> Optional[Dict[str, Any]]:
+        """Load the newest result file if it was written after previous, the file kept by cleanup."""
+        result_files = self._scan_results(language, result_type)
+        if not result_files:
+            return None
+
+        mtime_ns, latest_results = result_files[0]
+        if previous is not None and mtime_ns <= previous[0]:
+            return None
+        return _load_json_cached(str(latest_results), mtime_ns)
 
     def get_available_implementations(self) -> List[str]:
         """Get list of available language implementations."""
-        implementations = []
-        for impl_dir in self.implementations_dir.iterdir():
-            if impl_dir.is_dir() and not impl_dir.name.startswith('.'):
-                implementations.append(impl_dir.name)
-        return implementations
-
-    def setup_implementation(self, language: str) -> bool:
+        with os.scandir(self.implementations_dir) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+
+    def _find_venv_python(self, impl_dir: Path) -> Optional[Path]:
+        """Return the interpreter of the first virtual environment in impl_dir, if any."""
+        venv_python = self._venv_python_cache.get(impl_dir)
+        if venv_python is not None:
+            return venv_python
+
+        for venv_dir in self._VENV_DIRS:
+            venv_python = impl_dir / venv_dir / self._VENV_PY_REL
+            if venv_python.is_file():
+                self._venv_python_cache[impl_dir] = venv_python
+                return venv_python
+        # A miss is not cached so a virtual environment created by setup is found
+        return None
+
+    def _resolve_python(self, impl_dir: Path) -> str:
+        """Return the virtual environment Python for impl_dir, falling back to sys.executable."""
+        venv_python = self._find_venv_python(impl_dir)
+        return str(venv_python) if venv_python else sys.executable
+
+    def _manifest_hash(self, language: str, impl_dir: Path) -> Optional[str]:
+        """Hash the dependency manifests of an implementation, or None if it has none."""
+        patterns = self._MANIFESTS.get(language, [])
+        with os.scandir(impl_dir) as entries:
+            manifests = sorted((entry.name, entry.path) for entry in entries
+                               if any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns)
+                               and entry.is_file())
+        if not manifests:
+            return None
+
+        digest = hashlib.blake2b()
+        for name, path in manifests:
+            digest.update(name.encode("utf-8") + b"\0")
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    async def setup_implementation(self, language: str) -> bool:
         """Set up dependencies for a specific language implementation."""
         impl_dir = self.implementations_dir / language
         if not impl_dir.exists():
             print(f"❌ Implementation directory not found: {language}")
             return False
 
+        if language == "python":
+            setup_present = self._find_venv_python(impl_dir) is not None
+        else:
+            setup_output = self._SETUP_OUTPUTS.get(language)
+            setup_present = setup_output is None or (impl_dir / setup_output).exists()
+
+        manifest_hash = self._manifest_hash(language, impl_dir)
+        if manifest_hash is not None and self._setup_hashes.get(language) == manifest_hash and setup_present:
+            print(f"♻️  {language} setup cached (dependencies unchanged)")
+            return True
+
         print(f"🔧 Setting up {language} implementation...")
 
         try:
             if language == "javascript":
-                subprocess.run(["npm", "install"], cwd=impl_dir, check=True)
+                await self._run_command(["npm", "install"], impl_dir)
             elif language == "python":
-                # Check if virtual environment exists, create if not
-                venv_path = impl_dir / "venv"
-                if not venv_path.exists():
+                # Reuse an existing virtual environment, create one if there is none
+                venv_python = self._find_venv_python(impl_dir)
+                if venv_python is None:
+                    venv_path = impl_dir / "venv"
                     print(f"Creating virtual environment at {venv_path}")
-                    subprocess.run([sys.executable, "-m", "venv", "venv"], cwd=impl_dir, check=True)
-
-                # Determine the Python executable in the virtual environment
-                if sys.platform == "win32":
-                    venv_python = venv_path / "Scripts" / "python.exe"
-                else:
-                    venv_python = venv_path / "bin" / "python"
+                    await self._run_command([sys.executable, "-m", "venv", "venv"], impl_dir)
+                    venv_python = venv_path / self._VENV_PY_REL
 
                 # Install requirements using the virtual environment Python
-                subprocess.run([str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"],
-                             cwd=impl_dir, check=True)
+                await self._run_command([str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"],
+                                        impl_dir)
             elif language == "java":
-                subprocess.run(["mvn", "compile"], cwd=impl_dir, check=True)
+                await self._run_command(["mvn", "compile"], impl_dir)
             elif language == "csharp":
-                subprocess.run(["dotnet", "restore"], cwd=impl_dir, check=True)
+                await self._run_command(["dotnet", "restore"], impl_dir)
             elif language == "rust":
-                subprocess.run(["cargo", "build"], cwd=impl_dir, check=True)
+                await self._run_command(["cargo", "build"], impl_dir)
             elif language == "go":
-                subprocess.run(["go", "mod", "tidy"], cwd=impl_dir, check=True)
-                subprocess.run(["go", "build"], cwd=impl_dir, check=True)
+                await self._run_command(["go", "mod", "tidy"], impl_dir)
+                await self._run_command(["go", "build"], impl_dir)
+
+            # Hashed again since setup may rewrite lockfiles (go mod tidy, npm install)
+            manifest_hash = self._manifest_hash(language, impl_dir)
+            if manifest_hash is not None:
+                self._setup_hashes[language] = manifest_hash
+                self._setup_cache_file.write_bytes(_dumps(self._setup_hashes))
 
             print(f"✅ {language} setup completed")
             return True
@@ -101,219 +365,65 @@ class ComparisonRunner:
             print(f"❌ Required tools not found for {language}")
             return False
 
-    def run_tests(self, language: str) -> Dict[str, Any]:
+    async def run_tests(self, language: str) -> Dict[str, Any]:
         """Run tests for a specific language implementation."""
         print(f"🧪 Running tests for {language}...")
+        return await self._invoke(language, "test")
+
+    async def run_benchmarks(self, language: str) -> Dict[str, Any]:
+        """Run benchmarks for a specific language implementation."""
+        print(f"⚡ Running benchmarks for {language}...")
+        return await self._invoke(language, "benchmark")
+
+    async def _invoke(self, language: str, mode: str) -> Dict[str, Any]:
+        """Run an implementation's runner in the given mode ("test" or "benchmark") and load its results."""
+        kind = "tests" if mode == "test" else "benchmarks"
+        create_error = self._create_error_result if mode == "test" else self._create_error_benchmark_result
 
-        # Clean up old test result files for this language
-        self.cleanup_old_results(language, "test_results")
+        # Clean up old result files for this language
+        previous_results = self.cleanup_old_results(language, f"{mode}_results")
 
         impl_dir = self.implementations_dir / language
+        log_path = self.results_dir / f"{language}_{mode}.log"
+
+        if language != "python" and language not in self._COMMANDS:
+            print(f"❌ Unknown language: {language}")
+            return create_error(language, f"Unknown language: {language}")
 
         try:
-            if language == "javascript":
-                result = subprocess.run(
-                    ["node", "test-runner.js", "test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "python":
-                # Check for virtual environment
-                venv_python = None
-                venv_dirs = ["venv", ".venv", "env", ".env"]
-                for venv_dir in venv_dirs:
-                    venv_path = impl_dir / venv_dir
-                    if venv_path.exists():
-                        if sys.platform == "win32":
-                            venv_python = venv_path / "Scripts" / "python.exe"
-                        else:
-                            venv_python = venv_path / "bin" / "python"
-                        if venv_python.exists():
-                            break
-                        else:
-                            venv_python = None
-
-                # Use virtual environment Python if found, otherwise use sys.executable
-                python_executable = str(venv_python) if venv_python else sys.executable
+            if language == "python":
+                python_executable = self._resolve_python(impl_dir)
                 print(f"Using Python interpreter: {python_executable}")
 
-                result = subprocess.run(
-                    [python_executable, "test_runner.py", "test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "java":
-                # Compile and run Java test runner
-                subprocess.run(["mvn", "compile"], cwd=impl_dir, check=True)
-                result = subprocess.run(
-                    ["mvn", "exec:java", "-Dexec.mainClass=org.fhirpath.comparison.TestRunner", "-Dexec.args=test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "csharp":
-                result = subprocess.run(
-                    ["dotnet", "run", "--", "test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "rust":
-                result = subprocess.run(
-                    ["cargo", "run", "--", "test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "go":
-                result = subprocess.run(
-                    ["go", "run", "main.go", "test"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+                await self._run_python_command(impl_dir, python_executable, mode, log_path)
             else:
-                print(f"❌ Unknown language: {language}")
-                return self._create_error_result(language, f"Unknown language: {language}")
+                await self._run_streamed(self._COMMANDS[language](mode), impl_dir, log_path)
 
             # Try to find and parse the results file
-            results_pattern = f"{language}_test_results*.json"
-            results_files = list(self.results_dir.glob(results_pattern))
-
-            if results_files:
-                # Get the most recent results file
-                latest_results = max(results_files, key=lambda p: p.stat().st_mtime)
-                with open(latest_results, 'r') as f:
-                    return json.load(f)
-            else:
+            results = self._load_new_results(language, f"{mode}_results", previous_results)
+
+            if results is not None:
+                return results
+            elif mode == "test":
                 # Fallback: parse output for basic info
                 print(f"⚠️  No results file found for {language}, using basic parsing")
-                return self._parse_output_for_results(language, result.stdout)
-
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to run tests for {language}: {e}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
-            return self._create_error_result(language, str(e))
-        except Exception as e:
-            print(f"❌ Error running tests for {language}: {e}")
-            return self._create_error_result(language, str(e))
-
-    def run_benchmarks(self, language: str) -> Dict[str, Any]:
-        """Run benchmarks for a specific language implementation."""
-        print(f"⚡ Running benchmarks for {language}...")
-
-        # Clean up old benchmark result files for this language
-        self.cleanup_old_results(language, "benchmark_results")
-
-        impl_dir = self.implementations_dir / language
-
-        try:
-            if language == "javascript":
-                result = subprocess.run(
-                    ["node", "test-runner.js", "benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "python":
-                # Check for virtual environment
-                venv_python = None
-                venv_dirs = ["venv", ".venv", "env", ".env"]
-                for venv_dir in venv_dirs:
-                    venv_path = impl_dir / venv_dir
-                    if venv_path.exists():
-                        if sys.platform == "win32":
-                            venv_python = venv_path / "Scripts" / "python.exe"
-                        else:
-                            venv_python = venv_path / "bin" / "python"
-                        if venv_python.exists():
-                            break
-                        else:
-                            venv_python = None
-
-                # Use virtual environment Python if found, otherwise use sys.executable
-                python_executable = str(venv_python) if venv_python else sys.executable
-                print(f"Using Python interpreter for benchmarks: {python_executable}")
-
-                result = subprocess.run(
-                    [python_executable, "test_runner.py", "benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "java":
-                result = subprocess.run(
-                    ["mvn", "exec:java", "-Dexec.mainClass=org.fhirpath.comparison.TestRunner", "-Dexec.args=benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "csharp":
-                result = subprocess.run(
-                    ["dotnet", "run", "--", "benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "rust":
-                result = subprocess.run(
-                    ["cargo", "run", "--", "benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            elif language == "go":
-                result = subprocess.run(
-                    ["go", "run", "main.go", "benchmark"],
-                    cwd=impl_dir,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            else:
-                print(f"❌ Unknown language: {language}")
-                return self._create_error_benchmark_result(language, f"Unknown language: {language}")
-
-            # Try to find and parse the results file
-            results_pattern = f"{language}_benchmark_results.json"
-            results_files = list(self.results_dir.glob(results_pattern))
-
-            if results_files:
-                # Get the most recent results file
-                latest_results = max(results_files, key=lambda p: p.stat().st_mtime)
-                with open(latest_results, 'r') as f:
-                    return json.load(f)
+                return self._parse_output_for_results(language, log_path)
             else:
-                # Fallback: create basic benchmark result
                 print(f"⚠️  No benchmark results file found for {language}")
-                return self._create_error_benchmark_result(language, "No results file generated")
+                return create_error(language, "No results file generated")
 
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to run benchmarks for {language}: {e}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
-            return self._create_error_benchmark_result(language, str(e))
+            print(f"❌ Failed to run {kind} for {language}: {e}")
+            print(f"Last output (full log in {log_path}):\n{e.output}")
+            return create_error(language, str(e), e.output)
         except Exception as e:
-            print(f"❌ Error running benchmarks for {language}: {e}")
-            return self._create_error_benchmark_result(language, str(e))
+            print(f"❌ Error running {kind} for {language}: {e}")
+            return create_error(language, str(e))
 
-    def _create_error_result(self, language: str, error_message: str) -> Dict[str, Any]:
+    def _create_error_result(self, language: str, error_message: str,
+                             output_tail: Optional[str] = None) -> Dict[str, Any]:
         """Create an error result structure for failed test runs."""
-        return {
+        result = {
             "language": language,
             "timestamp": time.time(),
             "tests": [],
@@ -325,10 +435,14 @@ class ComparisonRunner:
             },
             "error": error_message
         }
+        if output_tail:
+            result["output_tail"] = output_tail
+        return result
 
-    def _create_error_benchmark_result(self, language: str, error_message: str) -> Dict[str, Any]:
+    def _create_error_benchmark_result(self, language: str, error_message: str,
+                                       output_tail: Optional[str] = None) -> Dict[str, Any]:
         """Create an error result structure for failed benchmark runs."""
-        return {
+        result = {
             "language": language,
             "timestamp": time.time(),
             "benchmarks": [],
@@ -338,21 +452,30 @@ class ComparisonRunner:
             },
             "error": error_message
         }
-
-    def _parse_output_for_results(self, language: str, output: str) -> Dict[str, Any]:
-        """Parse test runner output to extract basic results when results file is not available."""
-        # Basic parsing - look for common patterns in output
-        lines = output.split('\n')
+        if output_tail:
+            result["output_tail"] = output_tail
+        return result
+
+    def _parse_output_for_results(self, language: str, log_path: Path) -> Dict[str, Any]:
+        """Parse a test runner's output log to extract basic results when results file is not available."""
+        # Basic parsing - look for common patterns in output. Plain substring
+        # checks per line beat a single MULTILINE regex over the buffer here.
+        # The log is read as bytes one line at a time so it is never held in
+        # memory whole; the ASCII-only bytes.lower() is enough for these markers.
+        passed_marker = '✅'.encode('utf-8')
+        failed_marker = '❌'.encode('utf-8')
 
         passed_count = 0
         total_count = 0
 
-        for line in lines:
-            if '✅' in line or 'passed' in line.lower():
-                passed_count += 1
-                total_count += 1
-            elif '❌' in line or 'failed' in line.lower() or 'error' in line.lower():
-                total_count += 1
+        with open(log_path, 'rb') as log:
+            for line in log:
+                lowered = line.lower()
+                if passed_marker in line or b'passed' in lowered:
+                    passed_count += 1
+                    total_count += 1
+                elif failed_marker in line or b'failed' in lowered or b'error' in lowered:
+                    total_count += 1
 
         return {
             "language": language,
@@ -369,23 +492,26 @@ class ComparisonRunner:
 
     def generate_report(self, test_results: List[Dict], benchmark_results: List[Dict]):
         """Generate comparison report from results."""
-        report = {
-            "comparison_report": {
-                "timestamp": time.time(),
-                "test_results": test_results,
-                "benchmark_results": benchmark_results,
-                "summary": {
-                    "languages_tested": len(test_results),
-                    "total_tests": sum(r["summary"]["total"] for r in test_results),
-                    "total_benchmarks": sum(len(r["benchmarks"]) for r in benchmark_results)
-                }
-            }
+        summary = {
+            "languages_tested": len(test_results),
+            "total_tests": sum(r["summary"]["total"] for r in test_results),
+            "total_benchmarks": sum(len(r["benchmarks"]) for r in benchmark_results)
         }
 
-        # Save detailed results
+        # Save detailed results, one language result per line, so only a
+        # single result is ever serialized in memory at a time
         report_file = self.results_dir / "comparison_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(report_file, 'wb') as f:
+            f.write(b'{"comparison_report": {\n"timestamp": ' + _dumps(time.time()) + b',\n')
+            for key, results in (("test_results", test_results), ("benchmark_results", benchmark_results)):
+                f.write(b'"' + key.encode() + b'": [')
+                separator = b'\n'
+                for result in results:
+                    f.write(separator)
+                    f.write(_dumps(result))
+                    separator = b',\n'
+                f.write(b'\n],\n')
+            f.write(b'"summary": ' + _dumps(summary) + b'\n}}\n')
 
         print(f"📊 Report saved to: {report_file}")
 
@@ -405,6 +531,37 @@ class ComparisonRunner:
             print(f"\n{lang}:")
             for bench in result["benchmarks"]:
                 print(f"  {bench['name']:25} | {bench['avg_time_ms']:6.2f} ms")
+            for bench in result.get("errors", []):
+                print(f"  {bench['name']:25} | error")
+
+async def run_languages(runner: ComparisonRunner, languages: List[str], args) -> tuple:
+    """Set up every language concurrently, then test and benchmark them one at a time, keeping results in language order."""
+    slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def setup(language: str) -> bool:
+        async with slots:
+            if not await runner.setup_implementation(language):
+                print(f"⏭️  Skipping {language} due to setup failure")
+                return False
+            return True
+
+    async with runner:
+        ready = await asyncio.gather(*(setup(language) for language in languages))
+        ready_languages = [language for language, ok in zip(languages, ready) if ok]
+
+        # Tests and benchmarks both report timings, so each language runs
+        # them alone rather than alongside other languages' builds and runs
+        test_results = []
+        if not (args.setup_only or args.benchmarks_only):
+            for language in ready_languages:
+                test_results.append(await runner.run_tests(language))
+
+        benchmark_results = []
+        if not (args.setup_only or args.tests_only):
+            for language in ready_languages:
+                benchmark_results.append(await runner.run_benchmarks(language))
+
+    return test_results, benchmark_results
 
 def main():
     parser = argparse.ArgumentParser(description="Run FHIRPath library comparison")
@@ -434,32 +591,12 @@ def main():
     print(f"🔍 Available implementations: {', '.join(available_languages)}")
     print(f"🎯 Testing languages: {', '.join(languages_to_test)}")
 
-    # Setup implementations
-    setup_success = {}
-    for language in languages_to_test:
-        setup_success[language] = runner.setup_implementation(language)
+    test_results, benchmark_results = asyncio.run(run_languages(runner, languages_to_test, args))
 
     if args.setup_only:
         print("✅ Setup completed")
         return
 
-    # Run tests and benchmarks
-    test_results = []
-    benchmark_results = []
-
-    for language in languages_to_test:
-        if not setup_success[language]:
-            print(f"⏭️  Skipping {language} due to setup failure")
-            continue
-
-        if not args.benchmarks_only:
-            test_result = runner.run_tests(language)
-            test_results.append(test_result)
-
-        if not args.tests_only:
-            benchmark_result = runner.run_benchmarks(language)
-            benchmark_results.append(benchmark_result)
-
     # Generate report
     if test_results or benchmark_results:
         runner.generate_report(test_results, benchmark_results)